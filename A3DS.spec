@@ -2,7 +2,7 @@
 
 
 a = Analysis(
-    ['A3DSv0.6.4.py'],
+    ['Source/A3DSv0.6.5.py'],
     pathex=[],
     binaries=[],
     datas=[],
@@ -10,7 +10,25 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        # Unused transitive imports: keeps the bundle (and cold-start I/O)
+        # down to what the app actually loads.
+        'tkinter',
+        'test',
+        'unittest',
+        'pydoc',
+        'PyQt6.QtWebEngine',
+        'PyQt6.QtWebEngineCore',
+        'PyQt6.QtWebEngineWidgets',
+        'PyQt6.QtQml',
+        'PyQt6.QtQuick',
+        'PyQt6.QtMultimedia',
+        'PyQt6.QtBluetooth',
+        'PyQt6.QtDesigner',
+        'PyQt6.QtPdf',
+        'PyQt6.QtSql',
+        'PyQt6.QtTest',
+    ],
     noarchive=False,
     optimize=0,
 )
@@ -1,38 +1,91 @@
 import sys
 import os
 import json
+import atexit
+import getpass
+import hashlib
+import stat
+import functools
+import collections
 import subprocess
 import tempfile
-import shutil
 import re
 import time
 import platform
-import urllib.request
-import ssl
 
 # PyQt Imports
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QMessageBox, QDialog, 
     QTextEdit, QRadioButton, QButtonGroup, QGroupBox, QSpinBox, 
-    QDoubleSpinBox, QFormLayout, QTabWidget, QCheckBox, QComboBox,
-    QLineEdit, QStackedWidget, QScrollArea, QProgressBar
+    QDoubleSpinBox, QFormLayout, QTabWidget, QCheckBox,
+    QLineEdit, QStackedWidget, QScrollArea,
+    QListWidget, QListWidgetItem
 )
-from PyQt6.QtGui import QAction
-from PyQt6.QtCore import QTimer, Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QAction, QTextCursor, QFontDatabase, QTextDocument
+from PyQt6.QtCore import QTimer, Qt, QThread, QObject, pyqtSignal, QSignalBlocker, QThreadPool, QCoreApplication
 
 # --- CONSTANTS ---
 APP_NAME = "A3DS"
 FULL_NAME = "Accessible 3-D Slicer"
 APP_VERSION = "v0.6.5"
+TITLE_STR = f"{APP_NAME} {APP_VERSION}"
+# Hoisted stylesheet literals: Qt caches parsed sheets by the exact string,
+# so reusing one interned constant avoids re-parsing per construction.
+STYLE_TITLE = "font-weight: bold; font-size: 16px;"
+STYLE_SUB = "font-size: 14px; margin-bottom: 10px;"
+STYLE_CREDIT = "font-style: italic;"
 UPDATE_URL = "https://api.github.com/repos/edr-xix/AccessibleSlicer/releases/latest"
 
 # --- UNIVERSAL SETTINGS PATH LOGIC ---
+PLATFORM = platform.system()  # computed once; queried in several paths
+
+# Hash-keyed slicer configs written this session; cleaned up on exit so
+# repeat slices with identical parameters can reuse the same file.
+_CFG_FILES = set()
+
+_SESSION_CFG_DIR = None
+
+def _cfg_dir():
+    # The hash-keyed filenames are predictable, so they must not live in
+    # the world-writable temp root where another user could pre-create
+    # them. makedirs ignores mode for a pre-existing directory, so the
+    # stable per-user path is only trusted after verifying it's a real
+    # directory we own with no group/other write access — otherwise the
+    # owner could swap files between our byte-compare and the slicer's
+    # read. Returns None when no private directory can be had at all.
+    global _SESSION_CFG_DIR
+    d = os.path.join(tempfile.gettempdir(), f"a3ds-{getpass.getuser()}")
+    try:
+        os.makedirs(d, mode=0o700, exist_ok=True)
+        st = os.lstat(d)
+        owned = st.st_uid == os.getuid() if hasattr(os, "getuid") else True
+        if stat.S_ISDIR(st.st_mode) and owned and not (st.st_mode & 0o022):
+            return d
+    except OSError:
+        pass
+    # Stable path is untrustworthy or uncreatable: use one private
+    # mkdtemp for the session (random name, 0700, reuse still works
+    # across slices) and let atexit file cleanup empty it.
+    if _SESSION_CFG_DIR is None:
+        try: _SESSION_CFG_DIR = tempfile.mkdtemp(prefix="a3ds-")
+        except OSError: pass
+    return _SESSION_CFG_DIR
+
+@atexit.register
+def _cleanup_cfg_files():
+    for p in _CFG_FILES:
+        try: os.remove(p)
+        except OSError: pass
+    if _SESSION_CFG_DIR:
+        try: os.rmdir(_SESSION_CFG_DIR)
+        except OSError: pass
+
 def get_settings_path():
     app_id = "A3DS"
-    if platform.system() == "Windows":
+    if PLATFORM == "Windows":
         base_path = os.environ.get("APPDATA", os.path.expanduser("~"))
-    elif platform.system() == "Darwin":  # macOS
+    elif PLATFORM == "Darwin":  # macOS
         base_path = os.path.expanduser("~/Library/Application Support")
     else:  # Linux
         base_path = os.path.expanduser("~/.config")
@@ -45,6 +98,29 @@ def get_settings_path():
 
 SETTINGS_FILE = get_settings_path()
 
+# orjson is optional; the stdlib fallback still writes compact separators so
+# the tokenizer has less to chew on either way.
+try:
+    import orjson
+    def _dumps(obj): return orjson.dumps(obj)
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj): return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    _loads = json.loads
+
+# Parsed settings are served from memory as long as the file's mtime is
+# unchanged; a save refreshes the cache so the next load is free too.
+_SETTINGS_CACHE = {"mtime": 0, "data": None}
+
+def load_settings():
+    mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+    if _SETTINGS_CACHE["data"] is not None and _SETTINGS_CACHE["mtime"] == mtime:
+        return _SETTINGS_CACHE["data"]
+    with open(SETTINGS_FILE, 'rb') as f:
+        data = _loads(f.read())
+    _SETTINGS_CACHE["mtime"] = mtime; _SETTINGS_CACHE["data"] = data
+    return data
+
 # --- RELEASE NOTES ---
 RELEASE_NOTES = f"""
 <h2>Welcome to {APP_NAME} {APP_VERSION}</h2>
@@ -59,15 +135,23 @@ RELEASE_NOTES = f"""
 <p><i>Developers: Elwin Rivera & Gemini 3.0</i></p>
 """
 
-# Serial Imports
-try:
-    import serial
-    from serial.tools import list_ports
-    def get_serial_ports():
+# Serial support: pyserial is imported lazily so it stays off the cold-start
+# path; nothing needs it until the user touches a printer feature.
+# comports() walks the registry/sysfs and can take hundreds of ms on
+# Windows; cache briefly so opening a dialog doesn't re-enumerate.
+# The Rescan/Refresh buttons pass force=True to pick up hot-plugs.
+_port_cache = {"ports": None, "ts": 0.0}
+def get_serial_ports(force=False):
+    try:
+        from serial.tools import list_ports
+    except ImportError:
+        return ["/dev/tty.usbserial", "COM3"]
+    now = time.monotonic()
+    if force or _port_cache["ports"] is None or now - _port_cache["ts"] > 5.0:
         ports = [port.device for port in list_ports.comports()]
-        return ports if ports else ["No ports found"]
-except ImportError:
-    def get_serial_ports(): return ["/dev/tty.usbserial", "COM3"]
+        _port_cache["ports"] = ports if ports else ["No ports found"]
+        _port_cache["ts"] = now
+    return _port_cache["ports"]
 
 # Defaults
 DEFAULTS = {
@@ -103,9 +187,19 @@ DEFAULTS = {
     "seam_position": "aligned",
     "wipe_on_retract": 0,
     "last_run_version": "",
-    "check_updates_on_startup": 1 
+    "check_updates_on_startup": 1
 }
 
+def derive_bed_params(p):
+    # Derived bed geometry, recomputed whenever params are saved so the
+    # per-slice path just reads ready-made values. Underscore keys are
+    # internal but harmless if they end up persisted alongside params.
+    by = float(p['bed_y'])
+    p["_safe_x"] = float(p['bed_x']) * 0.05
+    p["_safe_y"] = by * 0.05
+    p["_present_y"] = by * 0.95
+    p["_bed_shape"] = f"0x0,{p['bed_x']}x0,{p['bed_x']}x{p['bed_y']},0x{p['bed_y']}"
+
 MATERIALS = {
     "PLA":   {"nozzle": 205, "bed": 60,  "fan": 100},
     "PETG":  {"nozzle": 240, "bed": 80,  "fan": 50},
@@ -118,10 +212,65 @@ MATERIALS = {
 
 BAUD_RATES = ["115200", "250000", "230400", "9600"]
 
+# Radio-group button ids map straight into these tables in both dialogs;
+# a checkedId() lookup replaces the old per-button isChecked() ladders.
+MATERIAL_ORDER = ["PLA", "PETG", "ABS", "ASA", "TPU", "Nylon", "PC", "Custom"]
+SEAM_ORDER = ["aligned", "nearest", "rear", "random"]
+NOZZLE_SIZES = {1: 0.2, 2: 0.4, 3: 0.6, 4: 0.8, 5: 1.0}
+GCODE_FLAVORS = {2: "klipper", 3: "reprap"}          # default "marlin"
+GCODE_FLAVOR_IDS = {"klipper": 2, "reprap": 3}       # default button 1
+
+# --- SHARED UI BUILDERS ---
+_RELEASE_DOC = None
+def release_doc():
+    # Parsed once and shared: Qt re-tokenizes the HTML on every setHtml, and
+    # the same notes appear in ReleaseNotesDialog and the Updates tab.
+    global _RELEASE_DOC
+    if _RELEASE_DOC is None:
+        _RELEASE_DOC = QTextDocument()
+        _RELEASE_DOC.setHtml(RELEASE_NOTES)
+    return _RELEASE_DOC
+
+
+def build_radio_group(title, options, current=None, id_start=1):
+    # The dialogs are mostly stacks of identical radio groups; one builder
+    # keeps ids aligned with the *_ORDER tables and avoids re-typing the
+    # groupbox/layout/buttongroup plumbing per group.
+    grp = QGroupBox(title)
+    lay = QVBoxLayout()
+    # Uniform tight metrics: fewer pixels to lay out per pass, and every
+    # group shares one geometry configuration instead of per-dialog defaults.
+    lay.setSpacing(2)
+    lay.setContentsMargins(6, 2, 6, 2)
+    bg = QButtonGroup(grp)
+    for i, opt in enumerate(options, id_start):
+        r = QRadioButton(str(opt))
+        bg.addButton(r, i)
+        lay.addWidget(r)
+        if current is not None and opt == current: r.setChecked(True)
+    grp.setLayout(lay)
+    return grp, bg
+
+# --- PORT SCAN THREAD ---
+class PortScanner(QThread):
+    # comports() can stall for hundreds of ms behind USB hubs on Windows;
+    # run it off the UI thread and hand the list back via signal.
+    ports_ready = pyqtSignal(list)
+    def __init__(self, force=False):
+        super().__init__()
+        self.force = force
+    def run(self):
+        self.ports_ready.emit(get_serial_ports(self.force))
+
 # --- UPDATE LOGIC THREAD ---
 class UpdateChecker(QThread):
     finished = pyqtSignal(dict)
     def run(self):
+        # urllib/ssl are imported here, on the worker thread, so the TLS
+        # machinery stays off the cold-start path entirely.
+        import urllib.request
+        import urllib.error
+        import ssl
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) A3DS-Updater',
@@ -139,20 +288,23 @@ class UpdateChecker(QThread):
 
 # --- ACCESSIBLE CONTROLS ---
 class AccessSpinBox(QSpinBox):
+    # lineEdit() builds a fresh Python wrapper per call; cache it once.
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.lineEdit().setAccessibleName(self.accessibleName())
+        self._le = self.lineEdit()
+        self._le.setAccessibleName(self.accessibleName())
     def setAccessibleName(self, name):
         super().setAccessibleName(name)
-        self.lineEdit().setAccessibleName(name)
+        self._le.setAccessibleName(name)
 
 class AccessDoubleSpinBox(QDoubleSpinBox):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.lineEdit().setAccessibleName(self.accessibleName())
+        self._le = self.lineEdit()
+        self._le.setAccessibleName(self.accessibleName())
     def setAccessibleName(self, name):
         super().setAccessibleName(name)
-        self.lineEdit().setAccessibleName(name)
+        self._le.setAccessibleName(name)
 
 # --- HELPER WINDOWS ---
 class ReleaseNotesDialog(QDialog):
@@ -163,7 +315,7 @@ class ReleaseNotesDialog(QDialog):
         layout = QVBoxLayout()
         self.text = QTextEdit()
         self.text.setReadOnly(True)
-        self.text.setHtml(RELEASE_NOTES)
+        self.text.setDocument(release_doc())
         layout.addWidget(self.text)
         btn = QPushButton("Awesome!")
         btn.clicked.connect(self.accept)
@@ -189,6 +341,8 @@ class ParameterDialog(QDialog):
         self.setWindowTitle("Settings")
         self.setGeometry(150, 150, 500, 700)
         self.params = current_params
+        # No point invalidating geometry ~60 times while the tabs assemble.
+        self.setUpdatesEnabled(False)
         
         layout = QVBoxLayout()
         self.tabs = QTabWidget()
@@ -204,6 +358,8 @@ class ParameterDialog(QDialog):
         self.sw = QWidget()
         self.sl = QVBoxLayout(self.sw)
         self.bg_port = QButtonGroup()
+        self._port_buttons = {}
+        self._scanner = None
         
         self.sl.addStretch()
         self.sw.setLayout(self.sl)
@@ -212,26 +368,8 @@ class ParameterDialog(QDialog):
         grp_port.setLayout(self.v_port)
         con_layout.addRow(grp_port)
 
-        grp_baud = QGroupBox("Baud Rate")
-        v_baud = QVBoxLayout()
-        scroll_baud = QScrollArea()
-        scroll_baud.setWidgetResizable(True)
-        sw_baud = QWidget()
-        sl_baud = QVBoxLayout(sw_baud)
-        self.bg_baud = QButtonGroup()
-        
-        current_baud = self.params.get("baud_rate", "115200")
-        for i, b in enumerate(BAUD_RATES):
-            r = QRadioButton(b)
-            self.bg_baud.addButton(r, i)
-            sl_baud.addWidget(r)
-            if b == current_baud: r.setChecked(True)
-            
-        sl_baud.addStretch()
-        sw_baud.setLayout(sl_baud)
-        scroll_baud.setWidget(sw_baud)
-        v_baud.addWidget(scroll_baud)
-        grp_baud.setLayout(v_baud)
+        grp_baud, self.bg_baud = build_radio_group(
+            "Baud Rate", BAUD_RATES, id_start=0)
         con_layout.addRow(grp_baud)
         
         grp_poll = QGroupBox("Monitoring Speeds")
@@ -240,14 +378,12 @@ class ParameterDialog(QDialog):
         self.spin_poll_idle = AccessSpinBox()
         self.spin_poll_idle.setRange(1, 60)
         self.spin_poll_idle.setAccessibleName("Idle Update Frequency")
-        self.spin_poll_idle.setValue(int(self.params.get("poll_interval_idle", 2)))
         self.spin_poll_idle.setSuffix(" sec")
         l_poll.addRow("Idle (Manual Control):", self.spin_poll_idle)
         
         self.spin_poll_print = AccessSpinBox()
         self.spin_poll_print.setRange(1, 60)
         self.spin_poll_print.setAccessibleName("Printing Update Frequency")
-        self.spin_poll_print.setValue(int(self.params.get("poll_interval_print", 10)))
         self.spin_poll_print.setSuffix(" sec")
         l_poll.addRow("Printing (Active):", self.spin_poll_print)
         
@@ -255,7 +391,7 @@ class ParameterDialog(QDialog):
         con_layout.addRow(grp_poll)
         
         btn_refresh = QPushButton("Rescan Ports")
-        btn_refresh.clicked.connect(self.refresh_ports)
+        btn_refresh.clicked.connect(lambda: self.refresh_ports(force=True))
         con_layout.addRow("", btn_refresh)
         tab_con.setLayout(con_layout)
         self.tabs.addTab(tab_con, "Connection")
@@ -264,52 +400,21 @@ class ParameterDialog(QDialog):
         tab_mat = QWidget()
         mat_layout = QVBoxLayout()
         
-        grp_mat = QGroupBox("Material Defaults")
-        lay_mat = QVBoxLayout()
-        self.bg_mat = QButtonGroup()
-        
-        self.rad_pla = QRadioButton("PLA")
-        self.rad_petg = QRadioButton("PETG")
-        self.rad_abs = QRadioButton("ABS")
-        self.rad_asa = QRadioButton("ASA")
-        self.rad_tpu = QRadioButton("TPU")
-        self.rad_nylon = QRadioButton("Nylon")
-        self.rad_pc = QRadioButton("PC")
-        self.rad_custom = QRadioButton("Custom / Exotic")
-        
-        self.bg_mat.addButton(self.rad_pla, 1)
-        self.bg_mat.addButton(self.rad_petg, 2)
-        self.bg_mat.addButton(self.rad_abs, 3)
-        self.bg_mat.addButton(self.rad_asa, 4)
-        self.bg_mat.addButton(self.rad_tpu, 5)
-        self.bg_mat.addButton(self.rad_nylon, 6)
-        self.bg_mat.addButton(self.rad_pc, 7)
-        self.bg_mat.addButton(self.rad_custom, 8)
-        
-        lay_mat.addWidget(self.rad_pla)
-        lay_mat.addWidget(self.rad_petg)
-        lay_mat.addWidget(self.rad_abs)
-        lay_mat.addWidget(self.rad_asa)
-        lay_mat.addWidget(self.rad_tpu)
-        lay_mat.addWidget(self.rad_nylon)
-        lay_mat.addWidget(self.rad_pc)
-        lay_mat.addWidget(self.rad_custom)
-        grp_mat.setLayout(lay_mat)
+        grp_mat, self.bg_mat = build_radio_group(
+            "Material Defaults", MATERIAL_ORDER[:-1] + ["Custom / Exotic"])
         mat_layout.addWidget(grp_mat)
         
-        self.bg_mat.buttonToggled.connect(self.on_mat_toggle)
+        self.bg_mat.idToggled.connect(self.on_mat_toggle)
 
         form_mat = QFormLayout()
         self.spin_nozzle_temp = AccessSpinBox()
         self.spin_nozzle_temp.setRange(0, 350)
         self.spin_nozzle_temp.setAccessibleName("Nozzle Temperature")
-        self.spin_nozzle_temp.setValue(self.params.get("temp_nozzle", 205))
         form_mat.addRow("Nozzle Temp:", self.spin_nozzle_temp)
         
         self.spin_bed_temp = AccessSpinBox()
         self.spin_bed_temp.setRange(0, 120)
         self.spin_bed_temp.setAccessibleName("Bed Temperature")
-        self.spin_bed_temp.setValue(self.params.get("temp_bed", 60))
         form_mat.addRow("Bed Temp:", self.spin_bed_temp)
         
         mat_layout.addLayout(form_mat)
@@ -321,40 +426,15 @@ class ParameterDialog(QDialog):
         tab_qual = QWidget()
         v_qual = QVBoxLayout()
         
-        grp_noz = QGroupBox("Nozzle Size (mm)")
-        l_noz = QVBoxLayout()
-        self.bg_noz = QButtonGroup()
-        
-        self.rad_n02 = QRadioButton("0.2 mm")
-        self.rad_n04 = QRadioButton("0.4 mm")
-        self.rad_n06 = QRadioButton("0.6 mm")
-        self.rad_n08 = QRadioButton("0.8 mm")
-        self.rad_n10 = QRadioButton("1.0 mm")
-        self.rad_ncus = QRadioButton("Custom")
-        
-        self.bg_noz.addButton(self.rad_n02, 1)
-        self.bg_noz.addButton(self.rad_n04, 2)
-        self.bg_noz.addButton(self.rad_n06, 3)
-        self.bg_noz.addButton(self.rad_n08, 4)
-        self.bg_noz.addButton(self.rad_n10, 5)
-        self.bg_noz.addButton(self.rad_ncus, 6)
-        
-        l_noz.addWidget(self.rad_n02)
-        l_noz.addWidget(self.rad_n04)
-        l_noz.addWidget(self.rad_n06)
-        l_noz.addWidget(self.rad_n08)
-        l_noz.addWidget(self.rad_n10)
-        l_noz.addWidget(self.rad_ncus)
-        
+        grp_noz, self.bg_noz = build_radio_group(
+            "Nozzle Size (mm)", ["0.2 mm", "0.4 mm", "0.6 mm", "0.8 mm", "1.0 mm", "Custom"])
         self.spin_nozzle_custom = AccessDoubleSpinBox()
         self.spin_nozzle_custom.setRange(0.1, 2.0)
         self.spin_nozzle_custom.setSingleStep(0.1)
         self.spin_nozzle_custom.setValue(0.4)
-        l_noz.addWidget(self.spin_nozzle_custom)
+        grp_noz.layout().addWidget(self.spin_nozzle_custom)
         self.spin_nozzle_custom.hide()
-        
-        grp_noz.setLayout(l_noz)
-        self.bg_noz.buttonToggled.connect(self.on_nozzle_toggle)
+        self.bg_noz.idToggled.connect(self.on_nozzle_toggle)
         v_qual.addWidget(grp_noz)
 
         grp_adv = QGroupBox("Advanced Surface Quality")
@@ -364,53 +444,25 @@ class ParameterDialog(QDialog):
         self.spin_layer = AccessDoubleSpinBox()
         self.spin_layer.setRange(0.05, 0.8)
         self.spin_layer.setSingleStep(0.01)
-        self.spin_layer.setValue(self.params.get("layer_height", 0.20))
         form_adv.addRow("Layer Height:", self.spin_layer)
         
         self.spin_infill = AccessSpinBox()
         self.spin_infill.setRange(0, 100)
-        self.spin_infill.setValue(self.params.get("infill_density", 20))
         form_adv.addRow("Infill %:", self.spin_infill)
         
         self.spin_ele = AccessDoubleSpinBox()
         self.spin_ele.setRange(0.0, 1.0)
         self.spin_ele.setSingleStep(0.05)
-        self.spin_ele.setValue(self.params.get("elefant_foot_comp", 0.0))
         self.spin_ele.setAccessibleName("Elephant Foot Compensation")
         form_adv.addRow("Elephant Foot Comp (mm):", self.spin_ele)
         
         l_adv.addLayout(form_adv)
         
-        grp_seam = QGroupBox("Seam Position")
-        v_seam = QVBoxLayout()
-        self.bg_seam = QButtonGroup()
-        
-        self.rad_seam_aligned = QRadioButton("Aligned (Recommended)")
-        self.rad_seam_nearest = QRadioButton("Nearest")
-        self.rad_seam_rear = QRadioButton("Rear")
-        self.rad_seam_random = QRadioButton("Random")
-        
-        self.bg_seam.addButton(self.rad_seam_aligned, 1)
-        self.bg_seam.addButton(self.rad_seam_nearest, 2)
-        self.bg_seam.addButton(self.rad_seam_rear, 3)
-        self.bg_seam.addButton(self.rad_seam_random, 4)
-        
-        v_seam.addWidget(self.rad_seam_aligned)
-        v_seam.addWidget(self.rad_seam_nearest)
-        v_seam.addWidget(self.rad_seam_rear)
-        v_seam.addWidget(self.rad_seam_random)
-        grp_seam.setLayout(v_seam)
+        grp_seam, self.bg_seam = build_radio_group(
+            "Seam Position", ["Aligned (Recommended)", "Nearest", "Rear", "Random"])
         l_adv.addWidget(grp_seam)
         
-        saved_seam = self.params.get("seam_position", "aligned")
-        if saved_seam == "aligned": self.rad_seam_aligned.setChecked(True)
-        elif saved_seam == "nearest": self.rad_seam_nearest.setChecked(True)
-        elif saved_seam == "rear": self.rad_seam_rear.setChecked(True)
-        elif saved_seam == "random": self.rad_seam_random.setChecked(True)
-        else: self.rad_seam_aligned.setChecked(True)
-
         self.chk_wipe = QCheckBox("Wipe on Retract")
-        self.chk_wipe.setChecked(bool(self.params.get("wipe_on_retract", 0)))
         l_adv.addWidget(self.chk_wipe)
         
         grp_adv.setLayout(l_adv)
@@ -430,14 +482,12 @@ class ParameterDialog(QDialog):
         self.spin_ret_len.setRange(0, 20.0)
         self.spin_ret_len.setSingleStep(0.1)
         self.spin_ret_len.setAccessibleName("Retraction Length")
-        self.spin_ret_len.setValue(self.params.get("retract_len", 5.0))
         form_ret.addRow("Length (mm):", self.spin_ret_len)
         
         self.spin_min_travel = AccessDoubleSpinBox()
         self.spin_min_travel.setRange(0, 10.0)
         self.spin_min_travel.setSingleStep(0.1)
         self.spin_min_travel.setAccessibleName("Minimum Travel")
-        self.spin_min_travel.setValue(self.params.get("retract_min_travel", 2.0))
         form_ret.addRow("Min Travel (mm):", self.spin_min_travel)
         
         v_ret.addLayout(form_ret)
@@ -457,14 +507,15 @@ class ParameterDialog(QDialog):
         up_layout.addLayout(l_up_head)
         
         self.chk_auto_up = QCheckBox("Check automatically on startup")
-        self.chk_auto_up.setChecked(bool(self.params.get("check_updates_on_startup", 1)))
         up_layout.addWidget(self.chk_auto_up)
         
         up_layout.addSpacing(10)
         up_layout.addWidget(QLabel("Release Notes:"))
+        # Populated lazily in update_dialog_title: most Settings opens never
+        # visit the Updates tab, so don't parse the notes HTML for them.
         self.txt_up_notes = QTextEdit()
         self.txt_up_notes.setReadOnly(True)
-        self.txt_up_notes.setHtml(RELEASE_NOTES)
+        self._notes_loaded = False
         up_layout.addWidget(self.txt_up_notes)
         tab_update.setLayout(up_layout)
         self.tabs.addTab(tab_update, "Updates")
@@ -472,15 +523,15 @@ class ParameterDialog(QDialog):
         # TAB 6: About
         tab_about = QWidget()
         about_layout = QVBoxLayout()
-        title = QLabel(f"{APP_NAME} {APP_VERSION}")
-        title.setStyleSheet("font-weight: bold; font-size: 16px;")
+        title = QLabel(TITLE_STR)
+        title.setStyleSheet(STYLE_TITLE)
         about_layout.addWidget(title)
         sub = QLabel(f"{FULL_NAME}")
-        sub.setStyleSheet("font-size: 14px; margin-bottom: 10px;")
+        sub.setStyleSheet(STYLE_SUB)
         about_layout.addWidget(sub)
         
         credit = QLabel("Developers:\n- Elwin Rivera\n- Gemini 3.0")
-        credit.setStyleSheet("font-style: italic;")
+        credit.setStyleSheet(STYLE_CREDIT)
         about_layout.addWidget(credit)
         
         about_layout.addStretch()
@@ -501,32 +552,62 @@ class ParameterDialog(QDialog):
         layout.addLayout(btn_box)
         self.setLayout(layout)
         
-        # Initial State Loading
-        curr_mat = self.params.get("material", "PLA")
-        if curr_mat == "PLA": self.rad_pla.setChecked(True)
-        elif curr_mat == "PETG": self.rad_petg.setChecked(True)
-        elif curr_mat == "ABS": self.rad_abs.setChecked(True)
-        elif curr_mat == "ASA": self.rad_asa.setChecked(True)
-        elif curr_mat == "TPU": self.rad_tpu.setChecked(True)
-        elif curr_mat == "Nylon": self.rad_nylon.setChecked(True)
-        elif curr_mat == "PC": self.rad_pc.setChecked(True)
-        else: self.rad_custom.setChecked(True)
-        
-        ns = self.params.get("nozzle_size", 0.4)
-        if ns == 0.2: self.rad_n02.setChecked(True)
-        elif ns == 0.4: self.rad_n04.setChecked(True)
-        elif ns == 0.6: self.rad_n06.setChecked(True)
-        elif ns == 0.8: self.rad_n08.setChecked(True)
-        elif ns == 1.0: self.rad_n10.setChecked(True)
-        else:
-            self.rad_ncus.setChecked(True)
-            self.spin_nozzle_custom.setValue(float(ns))
-
-        self.refresh_ports() 
+        self.load_from(current_params)
+        self.setUpdatesEnabled(True)
+
+    def load_from(self, params):
+        # (Re)applies the params dict to the existing widgets so the pooled
+        # dialog can be shown again without rebuilding its ~40 widgets.
+        self.params = params
+        # Snapshot for save_values' no-change check before any widget writes.
+        self._orig_state = json.dumps(params, sort_keys=True)
+        self.dirty = False
+        g = params.get
+        self.spin_poll_idle.setValue(int(g("poll_interval_idle", 2)))
+        self.spin_poll_print.setValue(int(g("poll_interval_print", 10)))
+        self.spin_nozzle_temp.setValue(g("temp_nozzle", 205))
+        self.spin_bed_temp.setValue(g("temp_bed", 60))
+        self.spin_layer.setValue(g("layer_height", 0.20))
+        self.spin_infill.setValue(g("infill_density", 20))
+        self.spin_ele.setValue(g("elefant_foot_comp", 0.0))
+        self.chk_wipe.setChecked(bool(g("wipe_on_retract", 0)))
+        self.chk_auto_up.setChecked(bool(g("check_updates_on_startup", 1)))
+        self.spin_ret_len.setValue(g("retract_len", 5.0))
+        self.spin_min_travel.setValue(g("retract_min_travel", 2.0))
+        
+        # Restore checked states with group signals blocked: on_mat_toggle
+        # firing here would stomp the saved temperatures with the material
+        # defaults that were just overridden above.
+        groups = (self.bg_seam, self.bg_mat, self.bg_noz, self.bg_baud)
+        for bg in groups: bg.blockSignals(True)
+        
+        saved_seam = g("seam_position", "aligned")
+        sid = SEAM_ORDER.index(saved_seam) + 1 if saved_seam in SEAM_ORDER else 1
+        self.bg_seam.button(sid).setChecked(True)
+        
+        curr_mat = g("material", "PLA")
+        mid = MATERIAL_ORDER.index(curr_mat) + 1 if curr_mat in MATERIAL_ORDER else len(MATERIAL_ORDER)
+        self.bg_mat.button(mid).setChecked(True)
+        
+        ns = g("nozzle_size", 0.4)
+        nid = next((i for i, v in NOZZLE_SIZES.items() if v == ns), 6)
+        self.bg_noz.button(nid).setChecked(True)
+        if nid == 6: self.spin_nozzle_custom.setValue(float(ns))
+        self.spin_nozzle_custom.setVisible(nid == 6)
+        
+        baud = g("baud_rate", "115200")
+        if baud in BAUD_RATES: self.bg_baud.button(BAUD_RATES.index(baud)).setChecked(True)
+        
+        for bg in groups: bg.blockSignals(False)
+        
+        self.refresh_ports()
 
     def update_dialog_title(self, index):
         tab_name = self.tabs.tabText(index)
         self.setWindowTitle(f"Settings - {tab_name}")
+        if tab_name == "Updates" and not self._notes_loaded:
+            self.txt_up_notes.setDocument(release_doc())
+            self._notes_loaded = True
 
     def trigger_update_check(self):
         self.btn_up_check.setEnabled(False)
@@ -542,6 +623,11 @@ class ParameterDialog(QDialog):
             return
         latest = data.get("tag_name", APP_VERSION)
         body = data.get("body", "No release notes found on GitHub.")
+        # Swap in a private document first so the shared release-notes one
+        # isn't clobbered with the fetched text.
+        if self.txt_up_notes.document() is release_doc():
+            self.txt_up_notes.setDocument(QTextDocument(self.txt_up_notes))
+        self._notes_loaded = True
         self.txt_up_notes.setPlainText(body)
         if latest != APP_VERSION:
             self.lbl_up_status.setText(f"Update Found: {latest}")
@@ -551,49 +637,53 @@ class ParameterDialog(QDialog):
         else:
             self.lbl_up_status.setText(f"Up to date: {APP_VERSION}")
 
-    def on_mat_toggle(self, btn, checked):
+    def on_mat_toggle(self, bid, checked):
         if not checked: return
-        mat_name = btn.text().split(" ")[0]
-        if mat_name in MATERIALS:
-            p = MATERIALS[mat_name]
+        p = MATERIALS.get(MATERIAL_ORDER[bid - 1])
+        if p:
             self.spin_nozzle_temp.setValue(p["nozzle"])
             self.spin_bed_temp.setValue(p["bed"])
 
-    def on_nozzle_toggle(self, btn, checked):
+    def on_nozzle_toggle(self, bid, checked):
         if not checked: return
-        if self.rad_ncus.isChecked():
+        if bid == 6:
             self.spin_nozzle_custom.show()
             self.spin_nozzle_custom.setFocus()
         else:
             self.spin_nozzle_custom.hide()
 
-    def refresh_ports(self):
-        for i in reversed(range(self.sl.count())): 
-            w = self.sl.itemAt(i).widget()
-            if w: w.setParent(None)
-        
-        ports = get_serial_ports()
+    def refresh_ports(self, force=False):
+        # Replacing a running scanner would let its QThread be collected
+        # mid-scan ("QThread: Destroyed while thread is still running").
+        if self._scanner and self._scanner.isRunning(): return
+        self._scanner = PortScanner(force)
+        self._scanner.ports_ready.connect(self._apply_ports)
+        self._scanner.start()
+
+    def _apply_ports(self, ports):
+        # Diff against the existing buttons: an unchanged port list (the
+        # common case when the pooled dialog reopens) costs no widget churn.
         current_port = self.params.get("serial_port", "")
         
+        for name in list(self._port_buttons):
+            if name not in ports:
+                btn = self._port_buttons.pop(name)
+                self.bg_port.removeButton(btn); btn.deleteLater()
         for i, p in enumerate(ports):
-            r = QRadioButton(p)
-            self.bg_port.addButton(r, i)
-            self.sl.addWidget(r)
-            if p == current_port: r.setChecked(True)
-            elif i == 0 and not current_port: r.setChecked(True)
-        self.sl.addStretch()
+            if p not in self._port_buttons:
+                r = QRadioButton(p)
+                self.bg_port.addButton(r, i)
+                self.sl.insertWidget(self.sl.count() - 1, r)
+                self._port_buttons[p] = r
+        
+        if current_port in self._port_buttons:
+            self._port_buttons[current_port].setChecked(True)
+        elif not current_port and ports and ports[0] in self._port_buttons:
+            self._port_buttons[ports[0]].setChecked(True)
 
     def save_values(self):
-        if self.rad_pla.isChecked(): m = "PLA"
-        elif self.rad_petg.isChecked(): m = "PETG"
-        elif self.rad_abs.isChecked(): m = "ABS"
-        elif self.rad_asa.isChecked(): m = "ASA"
-        elif self.rad_tpu.isChecked(): m = "TPU"
-        elif self.rad_nylon.isChecked(): m = "Nylon"
-        elif self.rad_pc.isChecked(): m = "PC"
-        else: m = "Custom"
-        
-        self.params["material"] = m
+        mid = self.bg_mat.checkedId()
+        self.params["material"] = MATERIAL_ORDER[mid - 1] if 1 <= mid <= len(MATERIAL_ORDER) else "Custom"
         self.params["temp_nozzle"] = self.spin_nozzle_temp.value()
         self.params["temp_bed"] = self.spin_bed_temp.value()
         self.params["layer_height"] = self.spin_layer.value()
@@ -601,19 +691,11 @@ class ParameterDialog(QDialog):
         self.params["elefant_foot_comp"] = self.spin_ele.value()
         self.params["check_updates_on_startup"] = 1 if self.chk_auto_up.isChecked() else 0
         
-        if self.rad_seam_aligned.isChecked(): self.params["seam_position"] = "aligned"
-        elif self.rad_seam_nearest.isChecked(): self.params["seam_position"] = "nearest"
-        elif self.rad_seam_rear.isChecked(): self.params["seam_position"] = "rear"
-        elif self.rad_seam_random.isChecked(): self.params["seam_position"] = "random"
+        sid = self.bg_seam.checkedId()
+        if 1 <= sid <= len(SEAM_ORDER): self.params["seam_position"] = SEAM_ORDER[sid - 1]
         
         self.params["wipe_on_retract"] = 1 if self.chk_wipe.isChecked() else 0
-        nid = self.bg_noz.checkedId()
-        if nid == 1: self.params["nozzle_size"] = 0.2
-        elif nid == 2: self.params["nozzle_size"] = 0.4
-        elif nid == 3: self.params["nozzle_size"] = 0.6
-        elif nid == 4: self.params["nozzle_size"] = 0.8
-        elif nid == 5: self.params["nozzle_size"] = 1.0
-        else: self.params["nozzle_size"] = self.spin_nozzle_custom.value()
+        self.params["nozzle_size"] = NOZZLE_SIZES.get(self.bg_noz.checkedId(), self.spin_nozzle_custom.value())
         
         self.params["retract_len"] = self.spin_ret_len.value()
         self.params["retract_min_travel"] = self.spin_min_travel.value()
@@ -624,7 +706,9 @@ class ParameterDialog(QDialog):
             self.params["serial_port"] = self.bg_port.checkedButton().text()
         if self.bg_baud.checkedButton():
             self.params["baud_rate"] = self.bg_baud.checkedButton().text()
-            
+        
+        # Saving with nothing changed shouldn't cost a disk write.
+        self.dirty = json.dumps(self.params, sort_keys=True) != self._orig_state
         self.accept()
 
 # --- SETUP WIZARD ---
@@ -635,10 +719,37 @@ class SetupWizard(QDialog):
         self.setGeometry(150, 150, 600, 700)
         self.params = user_params
         self.paths = {"slicer": ""}
+        self._scanner = None
         self.layout = QVBoxLayout()
         self.stack = QStackedWidget()
-        
-        # PAGE 1: APP
+        self._page_builders = [self._build_page1, self._build_page2, self._build_page3,
+                               self._build_page4, self._build_page5, self._build_page6]
+        self._built = [False] * 6
+        for _ in self._page_builders: self.stack.addWidget(QWidget())
+        self._ensure_page(0)
+
+        self.layout.addWidget(self.stack)
+        nav_layout = QHBoxLayout()
+        self.btn_back = QPushButton("Exit Setup")
+        self.btn_back.clicked.connect(self.go_back)
+        self.btn_next = QPushButton("Next")
+        self.btn_next.clicked.connect(self.go_next)
+        self.btn_next.setDefault(True)
+        self.btn_next.setEnabled(False)
+        nav_layout.addWidget(self.btn_back); nav_layout.addWidget(self.btn_next)
+        self.layout.addLayout(nav_layout)
+        self.setLayout(self.layout)
+
+    def _ensure_page(self, idx):
+        if self._built[idx]: return
+        page = self._page_builders[idx]()
+        old = self.stack.widget(idx)
+        self.stack.removeWidget(old); old.deleteLater()
+        self.stack.insertWidget(idx, page)
+        self._built[idx] = True
+
+    # PAGE 1: APP
+    def _build_page1(self):
         self.page1 = QWidget()
         l1 = QVBoxLayout()
         l1.addWidget(QLabel("Step 1: Locate PrusaSlicer App"))
@@ -647,32 +758,18 @@ class SetupWizard(QDialog):
         l1.addWidget(self.btn_slicer)
         l1.addStretch()
         self.page1.setLayout(l1)
-        self.stack.addWidget(self.page1)
+        return self.page1
 
-        # PAGE 2: HARDWARE
+    # PAGE 2: HARDWARE
+    def _build_page2(self):
         self.page2 = QWidget()
         l2 = QVBoxLayout()
         l2.addWidget(QLabel("Step 2: Hardware"))
         
-        grp_flav = QGroupBox("Firmware (USB & Slicer)")
-        lf = QVBoxLayout()
-        self.bg_flav = QButtonGroup()
-        self.rad_marlin = QRadioButton("Marlin (Ender 3, Prusa, etc.)")
-        self.rad_klipper = QRadioButton("Klipper")
-        self.rad_reprap = QRadioButton("RepRap")
-        self.bg_flav.addButton(self.rad_marlin, 1)
-        self.bg_flav.addButton(self.rad_klipper, 2)
-        self.bg_flav.addButton(self.rad_reprap, 3)
-        lf.addWidget(self.rad_marlin)
-        lf.addWidget(self.rad_klipper)
-        lf.addWidget(self.rad_reprap)
-        
+        grp_flav, self.bg_flav = build_radio_group(
+            "Firmware (USB & Slicer)", ["Marlin (Ender 3, Prusa, etc.)", "Klipper", "RepRap"])
         flav = self.params.get("gcode_flavor", "marlin")
-        if flav == "klipper": self.rad_klipper.setChecked(True)
-        elif flav == "reprap": self.rad_reprap.setChecked(True)
-        else: self.rad_marlin.setChecked(True)
-        
-        grp_flav.setLayout(lf)
+        self.bg_flav.button(GCODE_FLAVOR_IDS.get(flav, 1)).setChecked(True)
         l2.addWidget(grp_flav)
         
         grp_bed = QGroupBox("Bed Size (mm)")
@@ -692,46 +789,24 @@ class SetupWizard(QDialog):
         grp_bed.setLayout(lb)
         l2.addWidget(grp_bed)
         
-        grp_noz = QGroupBox("Nozzle Size")
-        lnoz = QVBoxLayout()
-        self.bg_noz = QButtonGroup()
-        self.rad_02 = QRadioButton("0.2 mm")
-        self.rad_04 = QRadioButton("0.4 mm")
-        self.rad_06 = QRadioButton("0.6 mm")
-        self.rad_08 = QRadioButton("0.8 mm")
-        self.rad_10 = QRadioButton("1.0 mm")
-        self.rad_ncus = QRadioButton("Custom")
-        
-        self.bg_noz.addButton(self.rad_02, 1)
-        self.bg_noz.addButton(self.rad_04, 2)
-        self.bg_noz.addButton(self.rad_06, 3)
-        self.bg_noz.addButton(self.rad_08, 4)
-        self.bg_noz.addButton(self.rad_10, 5)
-        self.bg_noz.addButton(self.rad_ncus, 6)
-        
-        lnoz.addWidget(self.rad_02)
-        lnoz.addWidget(self.rad_04)
-        lnoz.addWidget(self.rad_06)
-        lnoz.addWidget(self.rad_08)
-        lnoz.addWidget(self.rad_10)
-        lnoz.addWidget(self.rad_ncus)
-        
+        grp_noz, self.bg_noz = build_radio_group(
+            "Nozzle Size", ["0.2 mm", "0.4 mm", "0.6 mm", "0.8 mm", "1.0 mm", "Custom"])
         self.spin_nozzle_custom = AccessDoubleSpinBox()
         self.spin_nozzle_custom.setRange(0.1, 2.0)
         self.spin_nozzle_custom.setValue(0.4)
-        lnoz.addWidget(self.spin_nozzle_custom)
+        grp_noz.layout().addWidget(self.spin_nozzle_custom)
         self.spin_nozzle_custom.hide()
         
-        self.bg_noz.buttonToggled.connect(self.on_nozzle_toggle)
-        self.rad_04.setChecked(True)
-        grp_noz.setLayout(lnoz)
+        self.bg_noz.idToggled.connect(self.on_nozzle_toggle)
+        self.bg_noz.button(2).setChecked(True)
         l2.addWidget(grp_noz)
         
         l2.addStretch()
         self.page2.setLayout(l2)
-        self.stack.addWidget(self.page2)
+        return self.page2
 
-        # PAGE 3: CONNECTION
+    # PAGE 3: CONNECTION
+    def _build_page3(self):
         self.page3 = QWidget()
         l3 = QVBoxLayout()
         l3.addWidget(QLabel("Step 3: Connection"))
@@ -750,29 +825,14 @@ class SetupWizard(QDialog):
         lusb.addWidget(self.scroll_usb)
         
         btn_refresh_p = QPushButton("Refresh Ports")
-        btn_refresh_p.clicked.connect(self.refresh_ports_wiz)
+        btn_refresh_p.clicked.connect(lambda: self.refresh_ports_wiz(force=True))
         lusb.addWidget(btn_refresh_p)
         
         grp_usb.setLayout(lusb)
         l3.addWidget(grp_usb)
 
-        grp_baud = QGroupBox("Baud Rate")
-        lbaud = QVBoxLayout()
-        scroll_baud = QScrollArea()
-        scroll_baud.setWidgetResizable(True)
-        sw_b = QWidget()
-        sl_b = QVBoxLayout(sw_b)
-        self.bg_baud = QButtonGroup()
-        for i, baud in enumerate(BAUD_RATES):
-            r = QRadioButton(baud)
-            self.bg_baud.addButton(r, i)
-            sl_b.addWidget(r)
-            if baud == "115200": r.setChecked(True)
-        sl_b.addStretch()
-        sw_b.setLayout(sl_b)
-        scroll_baud.setWidget(sw_b)
-        lbaud.addWidget(scroll_baud)
-        grp_baud.setLayout(lbaud)
+        grp_baud, self.bg_baud = build_radio_group(
+            "Baud Rate", BAUD_RATES, "115200", id_start=0)
         l3.addWidget(grp_baud)
 
         grp_conn_set = QGroupBox("Connection Settings")
@@ -789,22 +849,17 @@ class SetupWizard(QDialog):
         l3.addWidget(grp_conn_set)
         
         self.page3.setLayout(l3)
-        self.stack.addWidget(self.page3)
+        self.refresh_ports_wiz()
+        return self.page3
 
-        # PAGE 4: SAFETY
+    # PAGE 4: SAFETY
+    def _build_page4(self):
         self.page4 = QWidget()
         l4 = QVBoxLayout()
         l4.addWidget(QLabel("Step 4: Safety & Retraction"))
-        grp_math = QGroupBox("Extrusion")
-        lm = QVBoxLayout()
-        self.bg_math = QButtonGroup()
-        self.rad_abs = QRadioButton("Absolute (Safe)")
-        self.rad_rel = QRadioButton("Relative")
-        self.bg_math.addButton(self.rad_abs, 0)
-        self.bg_math.addButton(self.rad_rel, 1)
-        lm.addWidget(self.rad_abs); lm.addWidget(self.rad_rel)
-        self.rad_abs.setChecked(True)
-        grp_math.setLayout(lm)
+        grp_math, self.bg_math = build_radio_group(
+            "Extrusion", ["Absolute (Safe)", "Relative"], id_start=0)
+        self.bg_math.button(0).setChecked(True)
         l4.addWidget(grp_math)
         
         grp_ret = QGroupBox("Retraction")
@@ -821,9 +876,10 @@ class SetupWizard(QDialog):
         l4.addWidget(grp_ret)
         l4.addStretch()
         self.page4.setLayout(l4)
-        self.stack.addWidget(self.page4)
+        return self.page4
 
-        # PAGE 5: SPEED
+    # PAGE 5: SPEED
+    def _build_page5(self):
         self.page5 = QWidget()
         l5 = QVBoxLayout()
         l5.addWidget(QLabel("Step 5: Speeds"))
@@ -840,9 +896,10 @@ class SetupWizard(QDialog):
         l5.addLayout(form_spd)
         l5.addStretch()
         self.page5.setLayout(l5)
-        self.stack.addWidget(self.page5)
+        return self.page5
 
-        # PAGE 6: DEFAULTS
+    # PAGE 6: DEFAULTS
+    def _build_page6(self):
         self.page6 = QWidget()
         l6 = QVBoxLayout()
         l6.addWidget(QLabel("Step 6: Printing Defaults"))
@@ -850,14 +907,13 @@ class SetupWizard(QDialog):
         ldef = QVBoxLayout()
         ldef.addWidget(QLabel("Material:"))
         self.bg_def_mat = QButtonGroup()
-        mats = ["PLA", "PETG", "ABS", "ASA", "TPU", "Nylon", "PC", "Custom"]
-        for i, m in enumerate(mats, 1):
+        for i, m in enumerate(MATERIAL_ORDER, 1):
             r = QRadioButton(m)
             self.bg_def_mat.addButton(r, i)
             ldef.addWidget(r)
             if m == "PLA": r.setChecked(True)
         
-        self.bg_def_mat.buttonToggled.connect(self.on_wiz_mat_toggle)
+        self.bg_def_mat.idToggled.connect(self.on_wiz_mat_toggle)
         form_def = QFormLayout()
         self.wiz_temp_nozzle = AccessSpinBox()
         self.wiz_temp_nozzle.setRange(0, 350); self.wiz_temp_nozzle.setValue(205)
@@ -877,20 +933,7 @@ class SetupWizard(QDialog):
         grp_def.setLayout(ldef)
         l6.addWidget(grp_def); l6.addStretch()
         self.page6.setLayout(l6)
-        self.stack.addWidget(self.page6)
-
-        self.layout.addWidget(self.stack)
-        nav_layout = QHBoxLayout()
-        self.btn_back = QPushButton("Exit Setup")
-        self.btn_back.clicked.connect(self.go_back)
-        self.btn_next = QPushButton("Next")
-        self.btn_next.clicked.connect(self.go_next)
-        self.btn_next.setDefault(True)
-        self.btn_next.setEnabled(False)
-        nav_layout.addWidget(self.btn_back); nav_layout.addWidget(self.btn_next)
-        self.layout.addLayout(nav_layout)
-        self.setLayout(self.layout)
-        self.refresh_ports_wiz()
+        return self.page6
 
     def locate_slicer(self):
         fname, _ = QFileDialog.getOpenFileName(self, "Locate PrusaSlicer", "/Applications", "Applications (*.app);;Executables (*.exe)")
@@ -899,34 +942,45 @@ class SetupWizard(QDialog):
             self.btn_slicer.setText(f"Found: {os.path.basename(fname)}")
             self.btn_next.setEnabled(True); self.btn_next.setFocus()
 
-    def refresh_ports_wiz(self):
-        for i in reversed(range(self.sl_usb.count())): 
-            w = self.sl_usb.itemAt(i).widget()
-            if w: w.setParent(None)
-        ports = get_serial_ports()
+    def refresh_ports_wiz(self, force=False):
+        if self._scanner and self._scanner.isRunning(): return
+        self._scanner = PortScanner(force)
+        self._scanner.ports_ready.connect(self._apply_ports_wiz)
+        self._scanner.start()
+
+    def _apply_ports_wiz(self, ports):
+        # takeAt(0)+deleteLater frees the C++ widgets and triggers one
+        # relayout for the batch instead of one per removed button.
+        self.sw_usb.setUpdatesEnabled(False)
+        while (item := self.sl_usb.takeAt(0)) is not None:
+            w = item.widget()
+            if w: w.deleteLater()
+        _blocked = QSignalBlocker(self.bg_port)  # one dispatch for the batch, not one per button
         for i, port in enumerate(ports):
             r = QRadioButton(port)
             self.bg_port.addButton(r, i); self.sl_usb.addWidget(r)
             if i == 0: r.setChecked(True)
+        del _blocked
         self.sl_usb.addStretch()
+        self.sw_usb.setUpdatesEnabled(True)
 
-    def on_nozzle_toggle(self, btn, checked):
+    def on_nozzle_toggle(self, bid, checked):
         if not checked: return
-        if self.rad_ncus.isChecked():
+        if bid == 6:
             self.spin_nozzle_custom.show(); self.spin_nozzle_custom.setFocus()
         else: self.spin_nozzle_custom.hide()
 
-    def on_wiz_mat_toggle(self, btn, checked):
+    def on_wiz_mat_toggle(self, bid, checked):
         if not checked: return
-        mat_name = btn.text().split(" ")[0]
-        if mat_name in MATERIALS:
-            p = MATERIALS[mat_name]
+        p = MATERIALS.get(MATERIAL_ORDER[bid - 1])
+        if p:
             self.wiz_temp_nozzle.setValue(p["nozzle"])
             self.wiz_temp_bed.setValue(p["bed"])
 
     def go_next(self):
         idx = self.stack.currentIndex()
-        if idx < 5: 
+        if idx < 5:
+            self._ensure_page(idx + 1)
             self.stack.setCurrentIndex(idx + 1)
             self.btn_back.setText("Back")
             if idx == 4: self.btn_next.setText("Finish")
@@ -943,14 +997,13 @@ class SetupWizard(QDialog):
 
     def save_all(self):
         fid = self.bg_flav.checkedId()
-        self.params["gcode_flavor"] = "marlin" if fid == 1 else "klipper" if fid == 2 else "reprap"
+        self.params["gcode_flavor"] = GCODE_FLAVORS.get(fid, "marlin")
         self.params["bed_x"] = self.spin_bed_x.value()
         self.params["bed_y"] = self.spin_bed_y.value()
         self.params["bed_z"] = self.spin_bed_z.value()
         
         nid = self.bg_noz.checkedId()
-        sizes = {1:0.2, 2:0.4, 3:0.6, 4:0.8, 5:1.0}
-        self.params["nozzle_size"] = sizes.get(nid, self.spin_nozzle_custom.value())
+        self.params["nozzle_size"] = NOZZLE_SIZES.get(nid, self.spin_nozzle_custom.value())
 
         if self.bg_port.checkedButton(): self.params["serial_port"] = self.bg_port.checkedButton().text()
         if self.bg_baud.checkedButton(): self.params["baud_rate"] = self.bg_baud.checkedButton().text()
@@ -972,60 +1025,199 @@ class SetupWizard(QDialog):
         self.params["fan_speed"] = 100
 
 # --- PRINTER LOGIC ---
-class PrinterController:
-    def __init__(self, console_output):
+# Compiled once at import: one C-level scan per response, tolerant of T0:/
+# whitespace variations across Marlin/Klipper/RepRap report formats.
+# Sanitizing + encoding a command costs three allocations; the repeated ones
+# (M105/M114/M155 polls, jog moves) come straight out of this small cache.
+# The delete-table strips everything outside printable ASCII in one C-level
+# translate pass instead of a Python callback per character.
+_NONPRINTABLE = bytes(b for b in range(256) if not (32 <= b < 127))
+
+@functools.lru_cache(maxsize=32)
+def encode_cmd(cmd):
+    payload = cmd.strip().encode('ascii', 'ignore').translate(None, _NONPRINTABLE)
+    return payload.decode('ascii'), payload + b'\n'
+
+# One pass over the whole M20 listing: matches 8.3 and long names ending in
+# .g/.gco/.gcode, skipping the Begin/End banner lines by construction.
+M20_FILE_RE = re.compile(r"^(?P<name>\S+\.g(?:co(?:de)?)?)(?:\s+(?P<size>\d+))?\s*$", re.I | re.M)
+TEMP_RE = re.compile(r"T0?:(?P<nt>[-\d.]+)\s*/\s*(?P<ntt>[-\d.]+).*?B:(?P<bt>[-\d.]+)\s*/\s*(?P<btt>[-\d.]+)")
+TEMP_RE_B = re.compile(TEMP_RE.pattern.encode())  # bytes twin for the raw read loop
+POS_RE = re.compile(r"X:([0-9\.\-]+)\s+Y:([0-9\.\-]+)\s+Z:([0-9\.\-]+)")
+
+class PrinterController(QObject):
+    # Runs on a worker QThread: the UI emits the *_requested signals, which
+    # queue onto the worker, and results come back via log/status_changed so
+    # slow serial reads never block the event loop.
+    log = pyqtSignal(str)
+    status_changed = pyqtSignal(dict)
+    connection_changed = pyqtSignal(bool)
+    cmd_requested = pyqtSignal(str)
+    status_requested = pyqtSignal()
+    sd_list_requested = pyqtSignal()
+    sd_listing = pyqtSignal(str)
+    connect_requested = pyqtSignal(str, str)
+    disconnect_requested = pyqtSignal()
+
+    # Prebuilt poll payloads: the status path writes these directly,
+    # skipping encode_cmd sanitization and console logging entirely.
+    _M105 = b"M105\n"
+    _M114 = b"M114\n"
+
+    def __init__(self):
+        super().__init__()
         self.ser = None
         self.is_connected = False
-        self.console = console_output
         self.firmware_type = "marlin"
         self.status = {"bed_temp": "--", "bed_target": "--", "nozzle_temp": "--", "nozzle_target": "--", "position": "X-- Y-- Z--"}
-        self.temp_regex = re.compile(r"T:([0-9\.]+) /([0-9\.]+) B:([0-9\.]+) /([0-9\.]+)")
-        self.pos_regex = re.compile(r"X:([0-9\.\-]+)\s+Y:([0-9\.\-]+)\s+Z:([0-9\.\-]+)")
-    
+        self._rx_buf = bytearray()
+        self._last_temp_report = 0.0
+        self.sd_cache = None   # parsed M20 listing, valid for one connection
+        self.cmd_requested.connect(self.send_command)
+        self.status_requested.connect(self.get_status)
+        self.sd_list_requested.connect(self.list_sd)
+        self.connect_requested.connect(self.connect)
+        self.disconnect_requested.connect(self.disconnect)
+
     def set_firmware(self, fw_type):
         self.firmware_type = fw_type.lower()
-        self.console.append(f"Firmware Protocol set to: {self.firmware_type}")
+        self.log.emit(f"Firmware Protocol set to: {self.firmware_type}")
 
     def connect(self, port, baud):
         if self.is_connected: self.disconnect()
         try:
+            import serial
             self.ser = serial.Serial()
             self.ser.port = port
             self.ser.baudrate = int(baud)
             self.ser.timeout = 1
+            self.ser.write_timeout = 1.0   # never hang forever on a stalled USB stack
+            self.ser.exclusive = True      # POSIX: fail fast if another host app owns the port
+            self.ser.dsrdtr = False
+            self.ser.rtscts = False
             self.ser.dtr = False 
             self.ser.rts = False
             self.ser.open()
-            time.sleep(2)
+            if PLATFORM == "Linux":
+                # FTDI/CH34x adapters default to a 16 ms USB latency timer,
+                # a hard floor under every round-trip; best-effort set 1 ms.
+                # The ioctl path needs no udev rule; sysfs is the fallback.
+                try:
+                    self.ser.set_low_latency_mode(True)
+                    self.log.emit("Serial low-latency mode enabled")
+                except (AttributeError, ValueError, OSError):
+                    try:
+                        name = os.path.basename(port)
+                        with open(f"/sys/bus/usb-serial/devices/{name}/latency_timer", "w") as f:
+                            f.write("1")
+                        self.log.emit("USB latency timer set to 1 ms")
+                    except OSError:
+                        pass
+            elif PLATFORM == "Windows":
+                # Default driver rings are 4 KB; widen them so coalesced
+                # batch writes and M20 listings don't bounce off the cap.
+                try: self.ser.set_buffer_size(rx_size=65536, tx_size=65536)
+                except Exception: pass
+            # DTR is held low so most boards skip the auto-reset; drain the
+            # boot banner (if any) instead of unconditionally sleeping 2s.
+            self.ser.timeout = 2
+            self.ser.read_until(b"start")
+            self.ser.reset_input_buffer()
+            self.ser.timeout = 1
             self.is_connected = True
-            self.console.append(f"*** CONNECTED to {port} ***")
+            self.sd_cache = None
+            self.log.emit(f"*** CONNECTED to {port} ***")
+            self.connection_changed.emit(True)
+            # Ask the firmware to push temperatures every 2s so status polls
+            # stop paying an M105 round-trip (ignored where M155 is absent).
+            self.send_command("M155 S2", log=False)
             return True
         except Exception as e:
-            self.console.append(f"*** CONNECTION FAILED: {e} ***")
+            self.log.emit(f"*** CONNECTION FAILED: {e} ***")
         return False
             
     def disconnect(self):
-        if self.ser and self.ser.is_open: self.ser.close()
+        if self.ser and self.ser.is_open:
+            # Stop auto-reports so the firmware isn't narrating to a
+            # closed port (harmless but noisy on reconnect elsewhere).
+            try: self.ser.write(b"M155 S0\n")
+            except Exception: pass
+            self.ser.close()
         self.is_connected = False
-        self.console.append("*** DISCONNECTED ***")
+        self.log.emit("*** DISCONNECTED ***")
+        self.connection_changed.emit(False)
         return True
         
     def send_command(self, cmd, log=True):
         if not self.is_connected: return None
-        clean_cmd = "".join(filter(lambda x: x.isprintable(), cmd.strip()))
+        clean_cmd, payload = encode_cmd(cmd)
         try:
-            self.ser.write((clean_cmd + '\n').encode('utf-8'))
-            if log and 'M105' not in clean_cmd: self.console.append(f"SENT: {clean_cmd}")
-            time.sleep(0.1)
-            if self.ser.in_waiting:
-                resp = self.ser.read(self.ser.in_waiting).decode('utf-8', errors='ignore')
-                if log and 'M105' not in clean_cmd: self.console.append(f"RECV: {resp.strip()}")
+            self.ser.write(payload)
+            if log and 'M105' not in clean_cmd: self.log.emit(f"SENT: {clean_cmd}")
+            resp = self._read_response()
+            if resp:
+                if log and 'M105' not in clean_cmd: self.log.emit(f"RECV: {resp.strip()}")
                 return resp
-        except Exception as e: 
-            self.console.append(f"ERROR: {e}")
+        except Exception as e:
+            self.log.emit(f"ERROR: {e}")
             self.disconnect()
         return None
-        
+
+    def _read_response(self, deadline=1.0):
+        # Blocking reads sized to the OS buffer: the kernel wakes us when data
+        # arrives instead of us spinning on in_waiting with a fixed sleep.
+        # Bytes end-to-end: accumulate raw chunks, decode exactly once on
+        # return, so a long M20 listing stays O(n) instead of str += per line.
+        lines = []
+        end = time.monotonic() + deadline
+        while time.monotonic() < end:
+            # One blocking read for the first byte, then a single drain of
+            # whatever else arrived — instead of an in_waiting poll per pass.
+            chunk = self.ser.read(1)
+            if chunk:
+                waiting = self.ser.in_waiting
+                if waiting: chunk += self.ser.read(waiting)
+                self._rx_buf += chunk
+            for line in self._take_lines():
+                lines.append(line)
+                # Auto-reported temperature lines can land mid-response;
+                # parse them here (in bytes, no decode) so they aren't lost.
+                if b'B:' in line and b'T' in line:
+                    self._scan_temps_b(line)
+                if line.strip().lower().startswith((b'ok', b'wait')):
+                    return (b'\n'.join(lines) + b'\n').decode('utf-8', errors='ignore')
+            if not chunk and lines:
+                break
+        if not lines: return ''
+        return (b'\n'.join(lines) + b'\n').decode('utf-8', errors='ignore')
+        
+    def list_sd(self):
+        # The whole M21+M20 exchange runs here on the worker; send_command
+        # would swallow the listing through its trailing ok, so the dialog
+        # receives the raw text via sd_listing instead of scraping the port.
+        if not self.is_connected:
+            self.sd_listing.emit(""); return
+        self.send_command("M21", log=False)
+        try:
+            self.ser.write(b"M20\n")
+            self.sd_listing.emit(self._read_response(deadline=5.0))
+        except Exception as e:
+            self.log.emit(f"ERROR: {e}")
+            self.disconnect()
+            self.sd_listing.emit("")
+
+    def _take_lines(self):
+        # Completed lines come off the front of the accumulator with an
+        # in-place shift — no whole-buffer copy per line, so a response
+        # that dribbles in over many reads stays O(n) overall.
+        buf = self._rx_buf
+        while True:
+            nl = buf.find(b'\n')
+            if nl < 0: return
+            line = bytes(buf[:nl])
+            del buf[:nl + 1]
+            yield line
+
     def read_buffer(self):
         if not self.is_connected: return ""
         try:
@@ -1034,18 +1226,42 @@ class PrinterController:
         except: pass
         return ""
 
+    def _scan_temps_b(self, raw):
+        m = TEMP_RE_B.search(raw)
+        if m:
+            self.status["nozzle_temp"] = m.group("nt").decode()
+            self.status["nozzle_target"] = m.group("ntt").decode()
+            self.status["bed_temp"] = m.group("bt").decode()
+            self.status["bed_target"] = m.group("btt").decode()
+            self._last_temp_report = time.monotonic()
+
+    def _scan_temps(self, text):
+        if not text: return
+        m = TEMP_RE.search(text)
+        if m:
+            self.status["nozzle_temp"]=m.group("nt"); self.status["nozzle_target"]=m.group("ntt")
+            self.status["bed_temp"]=m.group("bt"); self.status["bed_target"]=m.group("btt")
+            self._last_temp_report = time.monotonic()
+
     def get_status(self):
         if not self.is_connected: return self.status
-        r = self.send_command("M105", log=False)
-        if r:
-            m = self.temp_regex.search(r)
-            if m: 
-                self.status["nozzle_temp"]=m.group(1); self.status["nozzle_target"]=m.group(2)
-                self.status["bed_temp"]=m.group(3); self.status["bed_target"]=m.group(4)
-        r = self.send_command("M114", log=False)
-        if r:
-            m = self.pos_regex.search(r)
+        # Fire-and-forget polling: parse whatever the firmware has already
+        # pushed (auto-reports plus last tick's replies), then queue the next
+        # queries without blocking. Readings lag one tick at most.
+        buf = self.read_buffer()
+        self._scan_temps(buf)
+        if buf:
+            m = POS_RE.search(buf)
             if m: self.status["position"] = f"X{m.group(1)} Y{m.group(2)} Z{m.group(3)}"
+        try:
+            if time.monotonic() - self._last_temp_report > 5:
+                self.ser.write(self._M105)
+            self.ser.write(self._M114)
+        except Exception as e:
+            self.log.emit(f"ERROR: {e}")
+            self.disconnect()
+            return self.status
+        self.status_changed.emit(dict(self.status))
         return self.status
 
 class SDCardManagerDialog(QDialog):
@@ -1053,15 +1269,20 @@ class SDCardManagerDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("SD Card Manager")
         self.controller = controller
+        # open_sd builds a fresh dialog every time; destroy it on close so
+        # Qt drops the sd_listing connection instead of accumulating one
+        # finish_refresh call per leaked dialog across opens.
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         self.resize(500, 600)
         self.layout = QVBoxLayout(self)
         self.parent_window = parent 
         
         self.file_group = QGroupBox("Files on SD Card")
-        self.scroll = QScrollArea(); self.scroll.setWidgetResizable(True)
-        self.sw = QWidget(); self.file_layout = QVBoxLayout(self.sw)
-        self.scroll.setWidget(self.sw)
-        self.file_group_layout = QVBoxLayout(); self.file_group_layout.addWidget(self.scroll)
+        # A single QListWidget: clear()/addItem() are C++-side, so a 500-file
+        # card doesn't cost one QRadioButton + lambda connection per file.
+        self.file_list = QListWidget()
+        self.file_list.setAccessibleName("SD Card Files")
+        self.file_group_layout = QVBoxLayout(); self.file_group_layout.addWidget(self.file_list)
         self.file_group.setLayout(self.file_group_layout); self.layout.addWidget(self.file_group)
 
         self.lbl_status = QLabel("Ready"); self.layout.addWidget(self.lbl_status)
@@ -1073,73 +1294,108 @@ class SDCardManagerDialog(QDialog):
         self.print_btn = QPushButton("Start Print from SD"); self.print_btn.clicked.connect(self.start_print)
         self.layout.addWidget(self.print_btn)
         
-        self.selected_file = None
-        self.wait_timer = QTimer(); self.wait_timer.setSingleShot(True); self.wait_timer.timeout.connect(self.finish_refresh)
-        self.start_refresh()
+        # The worker runs the M21+M20 exchange and hands the raw listing
+        # back on sd_listing; the GUI never touches the port.
+        if self.controller: self.controller.sd_listing.connect(self.finish_refresh)
+        # Reopening the dialog reuses the listing from this connection:
+        # the card directory only changes through us (M30) or a reseat,
+        # both of which invalidate the cache.
+        if self.controller and self.controller.sd_cache is not None:
+            self._populate(self.controller.sd_cache)
+        else:
+            self.start_refresh()
 
     def start_refresh(self):
-        for i in reversed(range(self.file_layout.count())): 
-            w = self.file_layout.itemAt(i).widget()
-            if w: w.setParent(None)
+        self.file_list.clear()
         if not self.controller.is_connected:
-            self.file_layout.addWidget(QLabel("Not Connected")); return
+            self.file_list.addItem("Not Connected"); return
         self.refresh_btn.setEnabled(False); self.del_btn.setEnabled(False)
-        self.lbl_status.setText("Listing files... Waiting 5s...")
-        self.controller.send_command("M21"); self.controller.send_command("M20")
-        self.wait_timer.start(5000)
-
-    def finish_refresh(self):
-        resp = self.controller.read_buffer()
+        self.lbl_status.setText("Listing files...")
+        self.controller.sd_list_requested.emit()
+
+    def finish_refresh(self, resp):
+        entries = [(m.group(0).strip(), m.group("name")) for m in M20_FILE_RE.finditer(resp)] if resp else []
+        # Only a listing that reached the sentinel is trustworthy enough to
+        # cache; a timeout-truncated (or empty) one must retry next open.
+        if "End file list" in resp:
+            self.controller.sd_cache = entries
         self.lbl_status.setText("List Updated.")
+        self._populate(entries)
+
+    def _populate(self, entries):
+        self.file_list.clear()
         self.refresh_btn.setEnabled(True); self.del_btn.setEnabled(True)
-        found = False
-        if resp:
-            for line in resp.splitlines():
-                line = line.strip()
-                if not line or line.startswith("Begin") or line.startswith("End"): continue
-                parts = line.split()
-                if not parts: continue
-                fname = parts[0]
-                if os.path.splitext(fname)[1].lower() in [".gcode", ".gco", ".g"]:
-                    r = QRadioButton(line)
-                    r.toggled.connect(lambda c, f=fname: self.set_file(f) if c else None)
-                    self.file_layout.addWidget(r); found = True
-        if not found: self.file_layout.addWidget(QLabel("No G-code files found."))
-        self.file_layout.addStretch()
-
-    def set_file(self, f): self.selected_file = f
+        for display, name in entries:
+            item = QListWidgetItem(display)
+            item.setData(Qt.ItemDataRole.UserRole, name)
+            self.file_list.addItem(item)
+        if self.file_list.count(): self.file_list.setCurrentRow(0)
+        else: self.file_list.addItem("No G-code files found.")
+
+    def current_file(self):
+        item = self.file_list.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
     def delete_file(self):
-        if self.selected_file and QMessageBox.question(self, "Confirm", f"Delete {self.selected_file}?") == QMessageBox.StandardButton.Yes:
-            self.controller.send_command(f"M30 {self.selected_file}")
+        f = self.current_file()
+        if f and QMessageBox.question(self, "Confirm", f"Delete {f}?") == QMessageBox.StandardButton.Yes:
+            self.controller.cmd_requested.emit(f"M30 {f}")
+            self.controller.sd_cache = None
             self.start_refresh()
 
     def start_print(self):
-        if self.selected_file:
-            self.controller.send_command(f"M23 {self.selected_file}")
-            self.controller.send_command("M24")
+        f = self.current_file()
+        if f:
+            self.controller.cmd_requested.emit(f"M23 {f}")
+            self.controller.cmd_requested.emit("M24")
             if self.parent_window.params.get("disconnect_on_sd", 0) == 1:
-                self.controller.disconnect()
+                self.controller.disconnect_requested.emit()
             else:
                 self.parent_window.set_polling_mode("print")
             self.accept()
 
 class SlicingThread(QThread):
-    finished_sig = pyqtSignal(int, str, str) 
+    finished_sig = pyqtSignal(int, str, str)
+    progress_sig = pyqtSignal(str)
     def __init__(self, cmd):
         super().__init__()
         self.cmd = cmd
+        self._proc = None
     def run(self):
         try:
-            proc = subprocess.run(self.cmd, capture_output=True, text=True, check=False)
-            self.finished_sig.emit(proc.returncode, self.cmd[-1], proc.stdout + proc.stderr)
+            # Stream stdout line-by-line instead of buffering the whole
+            # slicer log in memory; progress reaches the GUI as it happens.
+            self._proc = subprocess.Popen(self.cmd, stdout=subprocess.PIPE,
+                                          stderr=subprocess.STDOUT, bufsize=65536)
+            # Binary bulk reads, decoded once per batch on this worker;
+            # emits at most every 100 ms and only on line boundaries so a
+            # chatty slicer can't queue one GUI event per line.
+            out = self._proc.stdout
+            pending = bytearray(); next_emit = time.monotonic() + 0.1
+            while True:
+                chunk = out.read1(65536)
+                if not chunk: break
+                pending += chunk
+                now = time.monotonic()
+                if now >= next_emit:
+                    nl = pending.rfind(b'\n')
+                    if nl >= 0:
+                        self.progress_sig.emit(pending[:nl + 1].decode('utf-8', 'ignore'))
+                        del pending[:nl + 1]
+                        next_emit = now + 0.1
+            if pending: self.progress_sig.emit(pending.decode('utf-8', 'ignore'))
+            out.close()
+            self.finished_sig.emit(self._proc.wait(), self.cmd[-1], "")
         except Exception as e:
             self.finished_sig.emit(1, "", str(e))
+    def cancel(self):
+        if self._proc and self._proc.poll() is None: self._proc.terminate()
 
 # --- MAIN WINDOW ---
 class CombinedWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.setWindowTitle(f"{APP_NAME} {APP_VERSION}")
+        self.setWindowTitle(TITLE_STR)
         self.resize(900, 700)
         self.params = DEFAULTS.copy()
         self.slicer_exe = ""
@@ -1147,8 +1403,17 @@ class CombinedWindow(QMainWindow):
         self.last_gcode = ""
         self.ctl = None
         self.is_printing = False
+        self.poll_mode = "idle"
+        self._poll_scale = 1
+        self._last_status = {}
+        self._settings_dirty = False
+        self._settings_dlg = None
+        self.save_timer = QTimer(); self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(500); self.save_timer.timeout.connect(self._flush_settings)
         self.initUI()
-        QTimer.singleShot(100, self.check_setup)
+        # Deferred so the first paint happens before settings I/O / wizard;
+        # 0 ms = first event-loop turn rather than an arbitrary extra delay.
+        QTimer.singleShot(0, self.check_setup)
 
     def initUI(self):
         menubar = self.menuBar()
@@ -1166,12 +1431,15 @@ class CombinedWindow(QMainWindow):
         self.tabs.addTab(self.create_slicer_tab(), "Slicer")
         self.tabs.addTab(self.create_printer_tab(), "Printer Control")
         self.tabs.currentChanged.connect(self.update_main_title)
+        self.tabs.currentChanged.connect(self.gate_status_timer)
 
     def update_main_title(self, index):
-        self.setWindowTitle(f"{self.tabs.tabText(index)} - {APP_NAME} {APP_VERSION}")
+        self.setWindowTitle(f"{self.tabs.tabText(index)} - {TITLE_STR}")
 
     def create_slicer_tab(self):
         tab = QWidget(); layout = QVBoxLayout(tab)
+        # No repaints while the tab tree is assembled; one relayout at show.
+        tab.setUpdatesEnabled(False)
         layout.addWidget(QLabel("1. Select Model"))
         self.btn_file = QPushButton("Select STL/3MF/OBJ..."); self.btn_file.clicked.connect(self.select_file)
         layout.addWidget(self.btn_file)
@@ -1198,16 +1466,21 @@ class CombinedWindow(QMainWindow):
         
         layout.addSpacing(20)
         self.btn_slice = QPushButton("Slice and Save G-code"); self.btn_slice.clicked.connect(self.start_slice)
-        layout.addWidget(self.btn_slice); self.slice_log = ""
+        layout.addWidget(self.btn_slice)
+        # Bounded so a long slice can't pin MBs of slicer output for the
+        # process lifetime; joined only when the log window opens.
+        self.slice_log = collections.deque(maxlen=5000)
+        tab.setUpdatesEnabled(True)
         return tab
 
     def create_printer_tab(self):
         tab = QWidget(); layout = QVBoxLayout(tab)
+        tab.setUpdatesEnabled(False)
         l_act = QHBoxLayout()
         self.btn_con = QPushButton("Connect"); self.btn_con.clicked.connect(self.toggle_connect)
         self.btn_sd = QPushButton("SD Card Manager"); self.btn_sd.clicked.connect(self.open_sd)
         self.btn_estop = QPushButton("EMERGENCY STOP"); self.btn_estop.setStyleSheet("background-color: red; color: white")
-        self.btn_estop.clicked.connect(lambda: self.ctl.send_command("M112"))
+        self.btn_estop.clicked.connect(lambda: self.ctl.cmd_requested.emit("M112"))
         l_act.addWidget(self.btn_con); l_act.addWidget(self.btn_sd); l_act.addWidget(self.btn_estop); layout.addLayout(l_act)
         
         grp_pos = QGroupBox("Axis Positions"); l_pos = QVBoxLayout(); self.lbl_pos = QLabel("X: --  Y: --  Z: --")
@@ -1223,17 +1496,38 @@ class CombinedWindow(QMainWindow):
         l_cmd.addWidget(self.line_cmd); l_cmd.addWidget(self.btn_send); layout.addLayout(l_cmd)
         
         layout.addWidget(QLabel("Console Output:")); self.console = QTextEdit(); self.console.setReadOnly(True)
-        layout.addWidget(self.console); self.ctl = PrinterController(self.console)
+        # Plain-text console: skip the rich-text parser, undo stack and word
+        # wrapping, none of which printer output needs.
+        self.console.setAcceptRichText(False)
+        self.console.setUndoRedoEnabled(False)
+        self.console.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.console.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        layout.addWidget(self.console)
+        self.console.document().setMaximumBlockCount(2000)
+        # Console writes are buffered and flushed in one cursor insert per
+        # tick so bursty printer output costs one relayout, not one per line.
+        self._log_buf = []
+        self.log_timer = QTimer(); self.log_timer.setInterval(50)
+        self.log_timer.timeout.connect(self.flush_log)
+        self.log_timer.start()
+        self.ctl = PrinterController()
+        self.ser_thread = QThread()
+        self.ctl.moveToThread(self.ser_thread)
+        self.ctl.log.connect(self._log_buf.append)
+        self.ctl.status_changed.connect(self.on_status_changed)
+        self.ctl.connection_changed.connect(self.on_connection_changed)
+        self.ser_thread.start()
         self.timer = QTimer(); self.timer.timeout.connect(self.update_status)
+        tab.setUpdatesEnabled(True)
         return tab
 
     def check_setup(self):
         if os.path.exists(SETTINGS_FILE):
             try:
-                with open(SETTINGS_FILE, 'r') as f:
-                    data = json.load(f)
+                data = load_settings()
                 self.slicer_exe = data.get("slicer", "")
                 self.params.update(data.get("params", {}))
+                derive_bed_params(self.params)
                 self.ctl.set_firmware(self.params.get("gcode_flavor", "marlin"))
                 if self.params.get("last_run_version", "") != APP_VERSION:
                     ReleaseNotesDialog(self).exec()
@@ -1265,11 +1559,41 @@ class CombinedWindow(QMainWindow):
             self.ctl.set_firmware(self.params.get("gcode_flavor", "marlin"))
 
     def open_config(self):
-        if ParameterDialog(self.params, self).exec(): self.save_settings()
+        # Built once and reused: widget construction dominates the cost of
+        # opening Settings, and the values are re-applied via load_from.
+        if self._settings_dlg is None:
+            self._settings_dlg = ParameterDialog(self.params, self)
+        else:
+            self._settings_dlg.load_from(self.params)
+        if self._settings_dlg.exec() and self._settings_dlg.dirty: self.save_settings()
 
     def save_settings(self):
+        # Coalesce bursts of saves into one write 500 ms later; the flush is
+        # an atomic replace so a crash mid-write can't truncate the file.
+        derive_bed_params(self.params)
+        self._settings_dirty = True
+        self.save_timer.start()
+
+    def _flush_settings(self):
+        if not self._settings_dirty: return
+        self._settings_dirty = False
+        # Snapshot + serialize here (cheap, and self.params can't mutate
+        # mid-dump); the disk syscalls run on the global pool so a slow
+        # SD-card-hosted install never stalls the GUI thread.
+        data = {"slicer": self.slicer_exe, "params": dict(self.params)}
+        try: payload = _dumps(data)
+        except: return
+        QThreadPool.globalInstance().start(lambda: self._write_settings(data, payload))
+
+    @staticmethod
+    def _write_settings(data, payload):
         try:
-            with open(SETTINGS_FILE, 'w') as f: json.dump({"slicer": self.slicer_exe, "params": self.params}, f)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(SETTINGS_FILE), suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp, SETTINGS_FILE)
+            _SETTINGS_CACHE["mtime"] = os.stat(SETTINGS_FILE).st_mtime_ns
+            _SETTINGS_CACHE["data"] = data
         except: pass
 
     def select_file(self):
@@ -1292,14 +1616,15 @@ class CombinedWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Missing file or slicer."); return
         
         p = self.params; scale_factor = self.spin_scale.value() / 100.0
-        safe_x = float(p['bed_x']) * 0.05
-        safe_y = float(p['bed_y']) * 0.05
+        if "_bed_shape" not in p: derive_bed_params(p)
+        safe_x = p["_safe_x"]
+        safe_y = p["_safe_y"]
         safe_z = 2.0
-        present_y = float(p['bed_y']) * 0.95
-        
+        present_y = p["_present_y"]
+
         config_text = f"""
 gcode_flavor = {p['gcode_flavor']}
-bed_shape = 0x0,{p['bed_x']}x0,{p['bed_x']}x{p['bed_y']},0x{p['bed_y']}
+bed_shape = {p['_bed_shape']}
 max_print_height = {p.get('bed_z', 250)}
 nozzle_diameter = {p['nozzle_size']}
 filament_diameter = {p.get('filament_diam', 1.75)}
@@ -1334,54 +1659,142 @@ end_gcode = M104 S0\\nM140 S0\\nG91\\nG1 E-1 F2700\\nG1 Z10\\nG90\\nG1 X0 Y{pres
         
         if not out_f: return
         try:
-            fd, cfg_path = tempfile.mkstemp(suffix=".ini", text=True)
-            with os.fdopen(fd, 'w') as tmp:
-                tmp.write(config_text)
-        except Exception as e: 
+            # Configs are keyed by content hash so re-slicing with unchanged
+            # parameters reuses the same (page-cache-hot) .ini on disk.
+            # Reuse is gated on the bytes actually matching — never trust a
+            # file at a guessable path just because it exists.
+            payload = config_text.encode()
+            cfg_root = _cfg_dir()
+            if cfg_root is None:
+                # No private directory available: baseline behavior, one
+                # unpredictable mkstemp per slice, no reuse.
+                fd, cfg_path = tempfile.mkstemp(suffix=".ini")
+                with os.fdopen(fd, 'wb') as tmp:
+                    tmp.write(payload)
+            else:
+                h = hashlib.blake2b(payload, digest_size=8).hexdigest()
+                cfg_path = os.path.join(cfg_root, f"a3ds_{h}.ini")
+                reuse = False
+                if os.path.exists(cfg_path):
+                    try:
+                        with open(cfg_path, 'rb') as f: reuse = f.read() == payload
+                    except OSError: pass
+                if not reuse:
+                    fd, tmp_path = tempfile.mkstemp(dir=cfg_root, suffix=".ini")
+                    with os.fdopen(fd, 'wb') as tmp:
+                        tmp.write(payload)
+                    os.replace(tmp_path, cfg_path)
+            # Adopt survivors from crashed sessions so they get cleaned up.
+            _CFG_FILES.add(cfg_path)
+        except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to create secure config: {e}"); return
 
         action_flag = "--export-3mf" if self.chk_3mf.isChecked() else "--slice"
         cmd = [self.slicer_exe, "--load", cfg_path, "--scale", str(scale_factor), action_flag, self.model_path, "--output", out_f]
         
         self.btn_slice.setEnabled(False); self.btn_slice.setText("Working...")
+        self.slice_log.clear()
         self.slicer_thread = SlicingThread(cmd)
+        self.slicer_thread.progress_sig.connect(self.on_slice_progress)
         self.slicer_thread.finished_sig.connect(self.on_slice_done)
-        self.slicer_thread.start(); self.temp_cfg = cfg_path
+        self.slicer_thread.start()
+
+    def on_slice_progress(self, chunk):
+        # Chunks arrive batched; split so the deque's line cap still holds.
+        self.slice_log.extend(chunk.splitlines(keepends=True))
 
     def on_slice_done(self, code, path, log):
         self.btn_slice.setEnabled(True); self.btn_slice.setText("Slice and Save G-code")
-        self.slice_log = log
-        if os.path.exists(self.temp_cfg): os.remove(self.temp_cfg)
+        if log: self.slice_log.append(log)
         if code == 0: QMessageBox.information(self, "Success", "Operation Complete!")
         else: QMessageBox.warning(self, "Failed", "Operation failed. Check debug logs.")
 
-    def show_logs(self): LogWindow(self.slice_log, self).exec()
+    def show_logs(self): LogWindow("".join(self.slice_log), self).exec()
 
     def set_polling_mode(self, mode):
         self.timer.stop()
+        self.poll_mode = mode
+        self._poll_scale = 1
+        # No point polling (and paying the M105/M114 round-trip) while the
+        # Printer tab is hidden; gate_status_timer resumes on tab change.
+        if self.tabs.currentIndex() != 1: return
         interval = int(self.params.get("poll_interval_print" if mode == "print" else "poll_interval_idle", 2)) * 1000
         self.timer.start(interval)
 
+    def gate_status_timer(self, index):
+        if not self.ctl or not self.ctl.is_connected: return
+        if index == 1: self.set_polling_mode(self.poll_mode)
+        else: self.timer.stop()
+
     def toggle_connect(self):
         if self.ctl.is_connected:
-            self.ctl.disconnect(); self.btn_con.setText("Connect"); self.timer.stop(); self.reset_labels()
+            self.ctl.disconnect_requested.emit()
         else:
             port = self.params.get("serial_port", "")
             if not port: QMessageBox.warning(self, "Error", "No port selected."); return
-            if self.ctl.connect(port, self.params.get("baud_rate", "115200")):
-                self.btn_con.setText("Disconnect"); self.set_polling_mode("idle")
+            self.ctl.connect_requested.emit(port, self.params.get("baud_rate", "115200"))
+
+    def on_connection_changed(self, connected):
+        if connected:
+            self.btn_con.setText("Disconnect"); self.set_polling_mode("idle")
+        else:
+            self.btn_con.setText("Connect"); self.timer.stop(); self.reset_labels()
 
     def reset_labels(self):
+        self._last_status.clear()
         self.lbl_noz.setText("Nozzle: -- / --"); self.lbl_bed.setText("Bed: -- / --"); self.lbl_pos.setText("X: --  Y: --  Z: --")
 
     def update_status(self):
-        s = self.ctl.get_status()
-        self.lbl_noz.setText(f"Nozzle: {s['nozzle_temp']} / {s['nozzle_target']}")
-        self.lbl_bed.setText(f"Bed: {s['bed_temp']} / {s['bed_target']}")
-        self.lbl_pos.setText(f"{s['position']}")
+        self.ctl.status_requested.emit()
+
+    def on_status_changed(self, s):
+        # Unchanged readings skip setText: no relayout, and no spurious
+        # re-announcements from screen readers tracking the labels.
+        last = self._last_status
+        noz = (s['nozzle_temp'], s['nozzle_target'])
+        if last.get('noz') != noz:
+            last['noz'] = noz; self.lbl_noz.setText(f"Nozzle: {noz[0]} / {noz[1]}")
+        bed = (s['bed_temp'], s['bed_target'])
+        if last.get('bed') != bed:
+            last['bed'] = bed; self.lbl_bed.setText(f"Bed: {bed[0]} / {bed[1]}")
+        if last.get('pos') != s['position']:
+            last['pos'] = s['position']; self.lbl_pos.setText(s['position'])
+        try:
+            moving = (abs(float(noz[0]) - float(last.get('_pnoz', noz[0]))) > 1.0
+                      or abs(float(bed[0]) - float(last.get('_pbed', bed[0]))) > 1.0
+                      or noz[1] != last.get('_pnt', noz[1]) or bed[1] != last.get('_pbt', bed[1]))
+        except (TypeError, ValueError):
+            moving = False
+        last['_pnoz'], last['_pnt'] = noz
+        last['_pbed'], last['_pbt'] = bed
+        self._adapt_poll(moving)
+
+    def _adapt_poll(self, moving):
+        # Steady temps back the poll off exponentially (up to 4x the
+        # configured rate) to spare the printer's command processor;
+        # any movement or setpoint change snaps back to the base rate.
+        if not self.timer.isActive(): return
+        self._poll_scale = 1 if moving else min(self._poll_scale * 2, 4)
+        base = int(self.params.get("poll_interval_print" if self.poll_mode == "print" else "poll_interval_idle", 2)) * 1000
+        target = base * self._poll_scale
+        if self.timer.interval() != target: self.timer.setInterval(target)
 
     def send_manual(self):
-        self.ctl.send_command(self.line_cmd.text()); self.line_cmd.clear()
+        self.ctl.cmd_requested.emit(self.line_cmd.text()); self.line_cmd.clear()
+
+    def flush_log(self):
+        if not self._log_buf: return
+        cur = self.console.textCursor()
+        cur.movePosition(QTextCursor.MoveOperation.End)
+        cur.insertText("\n".join(self._log_buf) + "\n")
+        self._log_buf.clear()
+
+    def closeEvent(self, event):
+        self.save_timer.stop(); self._flush_settings()
+        QThreadPool.globalInstance().waitForDone(2000)  # let a pending settings write land
+        if self.ctl.is_connected: self.ctl.disconnect_requested.emit()
+        self.ser_thread.quit(); self.ser_thread.wait(2000)
+        super().closeEvent(event)
 
     def open_sd(self):
         if not self.ctl.is_connected: QMessageBox.warning(self, "Error", "Not connected."); return
@@ -1390,6 +1803,16 @@ end_gcode = M104 S0\\nM140 S0\\nG91\\nG1 E-1 F2700\\nG1 Z10\\nG90\\nG1 X0 Y{pres
         if self.ctl.is_connected: self.set_polling_mode("idle")
 
 if __name__ == '__main__':
+    if getattr(sys, 'frozen', False):
+        # Frozen bundles know exactly where their Qt plugins live; pinning
+        # the path skips QApplication's directory probing at cold start.
+        # _MEIPASS is the bundle root for both onedir (_internal) and
+        # onefile layouts; the executable's directory is not.
+        base = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
+        plugin_dir = os.path.join(base, "PyQt6", "Qt6", "plugins")
+        if os.path.isdir(plugin_dir):
+            os.environ["QT_PLUGIN_PATH"] = plugin_dir
+            QCoreApplication.setLibraryPaths([plugin_dir])
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
     w = CombinedWindow(); w.show()